@@ -1,3 +1,3 @@
-from .rich_logger import RichLogger
+from .rich_logger import BufferedFileHandler, RichLogger
 
-__all__ = ["RichLogger"]
+__all__ = ["BufferedFileHandler", "RichLogger"]
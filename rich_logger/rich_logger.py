@@ -44,6 +44,22 @@ Usage
     logger.error("Failed to write output file")
     logger.debug("Developer check details")
 
+    # Plain stdout output for high-volume logging (or RICHLOGGER_PLAIN=1)
+    logger = RichLogger("project_name", pretty = False)
+
+    # Coalesce plain output into fewer, larger writes
+    logger = RichLogger("project_name", pretty = False, buffered = True)
+
+    # Format and write records on a background thread
+    logger = RichLogger("project_name", queued = True)
+
+    # Write straight to stdout, bypassing `logging` handlers entirely
+    logger = RichLogger("project_name", backend = "fast")
+
+    # Keep roughly 1% of check and debug records from hot loops
+    class SampledLogger(RichLogger):
+        SAMPLE_RATES = {"check": 0.01, "debug": 0.01}
+
 Dependencies
 ────────────
 - rich >= 13.0
@@ -52,7 +68,8 @@ Dependencies
 Limitations
 ───────────
 - Tested with Python 3.13.
-- Designed for console output; file logging requires additional handlers.
+- Designed for console output; file logging requires attaching a handler
+  such as `BufferedFileHandler` to `logger.logger`.
 - Rich formatting may not render properly in non-compatible terminals.
 - Traceback cannot be toggled.
 """
@@ -65,9 +82,382 @@ __license__ = "MIT"
 # Imports
 # ─────────────────────────────────────────────────────────────────────────────
 
+import atexit
+import copy
+import keyword
 import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import traceback
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from typing import NamedTuple
 from rich.logging import RichHandler
 from rich.console import Console
+from rich.text import Text
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ANSI Styling
+# ─────────────────────────────────────────────────────────────────────────────
+
+# SGR foreground codes for the Rich color names used in `LOG_CATEGORIES`
+_ANSI_COLORS = {
+    "black":   "30",
+    "red":     "31",
+    "green":   "32",
+    "yellow":  "33",
+    "blue":    "34",
+    "magenta": "35",
+    "cyan":    "36",
+    "white":   "37",
+}
+
+def _ansi_label(label, color):
+    """
+    Returns `label` padded to the standard width and wrapped in the ANSI
+    escape for `color`. Unknown colors leave the label unstyled.
+    """
+    code = _ANSI_COLORS.get(color)
+    if code is None:
+        return f"{label:<10}"
+    return f"\x1b[{code}m{label:<10}\x1b[0m"
+
+def _use_color(stream, color = None):
+    """
+    Decides whether plain output to `stream` carries ANSI colors. An explicit
+    `color` wins; otherwise colors are used only on a terminal and only when
+    the `NO_COLOR` environment variable is unset.
+    """
+    if color is not None:
+        return color
+    if "NO_COLOR" in os.environ:
+        return False
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
+
+# Output styles, each indexing a category's `formats`
+_RICH, _ANSI, _BARE = 0, 1, 2
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared Console
+# ─────────────────────────────────────────────────────────────────────────────
+
+_SHARED_CONSOLE = None
+
+def _get_console():
+    """
+    Returns the Rich console shared by all loggers, creating it on first use
+    so the terminal is probed once per process rather than once per logger.
+    """
+    global _SHARED_CONSOLE
+    if _SHARED_CONSOLE is None:
+        _SHARED_CONSOLE = Console()
+    return _SHARED_CONSOLE
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Configured Loggers
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _Setup(NamedTuple):
+    """
+    What `RichLogger` installed on a logger name: the output style its log
+    methods use, whether records carry their call site, the handler
+    attached to the logger, and, in queued mode, the listener feeding the
+    real handler from that (queue) handler.
+    """
+    style:     int
+    show_path: bool
+    handler:   logging.Handler
+    listener:  QueueListener | None = None
+
+# Setup of each logger name already configured
+_CONFIGURED: dict[str, _Setup] = {}
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Log Categories
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _Category(NamedTuple):
+    """
+    A `LOG_CATEGORIES` entry resolved into everything a log call needs, so
+    that labels are styled once rather than on every call. `formats` holds
+    the Rich markup, ANSI, and uncolored `%`-style templates, in that order,
+    each taking the message as its only argument. `sample_rate` is the
+    fraction of calls that are logged.
+    """
+    name:        str
+    label:       str
+    color:       str
+    level:       int
+    formats:     tuple[str, str, str]
+    exc_info:    bool
+    sample_rate: float
+
+    @classmethod
+    def from_properties(cls, name, properties, sample_rate = 1.0):
+        """
+        Builds a category from its `LOG_CATEGORIES` key and properties.
+
+        Strings are interned so that categories built at runtime (e.g. from
+        a config file) share one object per distinct value, as literals do.
+        `sample_rate` is coerced to a plain float, since it is written into
+        generated source, and must lie within [0, 1].
+        """
+        sample_rate = float(sample_rate)
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(
+                f"Sample rate for {name!r} must be between 0 and 1, "
+                f"got {sample_rate!r}"
+            )
+
+        label  = sys.intern(properties["label"])
+        color  = sys.intern(properties["color"])
+        labels = (
+            f"[{color}]{label:<10}[/]",
+            _ansi_label(label, color),
+            f"{label:<10}",
+        )
+        return cls(
+            name        = sys.intern(name),
+            label       = label,
+            color       = color,
+            level       = properties["level"],
+            formats     = tuple(
+                sys.intern(styled.replace("%", "%%") + " %s")
+                for styled in labels
+            ),
+            exc_info    = label.upper() == "DEBUG",
+            sample_rate = sample_rate
+        )
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Record Creation
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _log_without_caller(
+    logger, 
+    level, 
+    msg, 
+    *args, 
+    exc_info   = False, 
+    stacklevel = 1
+):
+    """
+    Stands in for `logger.log` on a RichLogger's own calls when no path is
+    displayed. The record gets the placeholder file, line, and function
+    `logging` uses for an unknown caller, sparing it the walk up the call
+    stack. Other users of the same stdlib logger are unaffected.
+    """
+    if isinstance(exc_info, BaseException):
+        exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+    elif exc_info and not isinstance(exc_info, tuple):
+        exc_info = sys.exc_info()
+
+    logger.handle(logger.makeRecord(
+        logger.name, 
+        level, 
+        "(unknown file)", 
+        0, 
+        msg, 
+        args, 
+        exc_info, 
+        "(unknown function)"
+    ))
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Timestamps
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _TimestampCache:
+    """
+    Formats epoch timestamps with `time.strftime`, reusing the result for
+    every timestamp that falls within the same second.
+    """
+
+    def __init__(self, fmt = "[%x %X]"):
+        self.fmt    = fmt
+        self._cache = (None, "")    # (second, formatted), swapped atomically
+
+    def __call__(self, created):
+        second = int(created)
+        cached_second, stamp = self._cache
+        if second != cached_second:
+            stamp       = time.strftime(self.fmt, time.localtime(second))
+            self._cache = (second, stamp)
+        return stamp
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    A `Formatter` whose `%(asctime)s` is formatted at most once per second.
+    """
+
+    def __init__(self, fmt = None, datefmt = "[%x %X]"):
+        super().__init__(fmt, datefmt)
+        self._timestamp = _TimestampCache(datefmt)
+
+    def formatTime(self, record, datefmt = None):
+        return self._timestamp(record.created)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Buffered Output
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    A `StreamHandler` that collects formatted records and writes them to the
+    stream in a single call.
+
+    The buffer is written once it holds `capacity` records, as soon as a
+    record at `flush_level` or above arrives, or `flush_interval` seconds
+    after the first buffered record, whichever comes first. `logging`
+    flushes all handlers at interpreter exit, so nothing is lost on shutdown.
+    """
+
+    def __init__(
+        self, 
+        stream         = None, 
+        capacity       = 32, 
+        flush_interval = 0.1, 
+        flush_level    = logging.WARNING
+    ):
+        super().__init__(stream)
+        self._init_buffer(capacity, flush_interval, flush_level)
+
+    def _init_buffer(self, capacity, flush_interval, flush_level):
+        """
+        Sets up the batching state, shared with `BufferedFileHandler`.
+        """
+        self.capacity       = capacity
+        self.flush_interval = flush_interval
+        self.flush_level    = flush_level
+        self._buffer        = []
+        self._timer         = None
+        self._last_record   = None    # Reported if a batched write fails
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self.lock:
+            self._buffer.append(msg)
+            self._last_record = record
+            if (len(self._buffer) >= self.capacity
+                    or record.levelno >= self.flush_level):
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(
+                    self.flush_interval, 
+                    self._timed_flush
+                )
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._buffer:
+                try:
+                    if self.stream:
+                        self.stream.write(self.terminator.join(self._buffer)
+                                          + self.terminator)
+                except Exception:
+                    self.handleError(self._last_record)
+                finally:
+                    self._buffer.clear()    # Dropped if there is no stream
+            super().flush()
+
+    def _timed_flush(self):
+        """
+        Flushes from the timer thread, where an exception would otherwise
+        escape `logging`'s error handling.
+        """
+        try:
+            self.flush()
+        except Exception:
+            self.handleError(self._last_record)
+
+class BufferedFileHandler(_BufferedStreamHandler, logging.FileHandler):
+    """
+    A `FileHandler` with the same batched writes as the buffered console
+    output, turning a `write()` per record into one per batch. Attach it to
+    `RichLogger.logger` alongside the console handler.
+    """
+
+    def __init__(
+        self, 
+        filename, 
+        mode           = "a", 
+        encoding       = None, 
+        capacity       = 32, 
+        flush_interval = 0.1, 
+        flush_level    = logging.WARNING
+    ):
+        logging.FileHandler.__init__(self, filename, mode, encoding)
+        self._init_buffer(capacity, flush_interval, flush_level)
+
+    def emit(self, record):
+        # Reopen after close(), as `FileHandler.emit` does
+        if self.stream is None:
+            if self.mode != "w" or not self._closed:
+                self.stream = self._open()
+        if self.stream:
+            super().emit(record)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Fast Backend
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _FastEmitter:
+    """
+    Writes log lines straight to a stream, bypassing `logging`'s records,
+    handlers, and formatters.
+
+    Called with the same arguments as `Logger.log`, so it can stand in for a
+    logger's `_emit`. The timestamp is formatted at most once per second.
+    """
+
+    def __init__(self, stream):
+        self._write     = stream.write
+        self._timestamp = _TimestampCache("[%x %X] ")
+
+    def __call__(self, level, msg, *args, exc_info = False, stacklevel = 1):
+        line = (self._timestamp(time.time())
+                + (msg % args if args else msg) + "\n")
+        if exc_info and sys.exc_info()[0] is not None:
+            line += traceback.format_exc()
+        self._write(line)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Queue Handling
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _LocalQueueHandler(QueueHandler):
+    """
+    Enqueues records untouched for a `QueueListener` in the same process.
+
+    The stock `prepare()` renders the message and drops `exc_info` so records
+    can be pickled. Pickling is not needed in-process, so this version only
+    renders the message, fixing it at call time even when the message is a
+    mutable object, and keeps `exc_info` so the RichHandler on the listener
+    thread can still draw rich tracebacks.
+    """
+
+    def prepare(self, record):
+        msg            = record.getMessage()
+        record         = copy.copy(record)
+        record.msg     = msg
+        record.args    = None
+        record.message = msg
+        return record
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Logger Class
@@ -171,83 +561,341 @@ class RichLogger:
         },
     }
 
+    # ─────────────────────────────────
+    # Sampling
+    # ─────────────────────────────────
+    # Fraction of calls logged per category, for categories that fire too
+    # often to keep every record (e.g. {"debug": 0.01}). Unlisted categories
+    # are always logged.
+    SAMPLE_RATES = {}
+
     # ─────────────────────────────────
     # Initialization
     # ─────────────────────────────────
-    def __init__(self, name: str):
+    def __init__(
+        self, 
+        name:           str, 
+        pretty:         bool  = True, 
+        queued:         bool  = False, 
+        show_path:      bool  = False,
+        buffered:       bool  = False,
+        buffer_size:    int   = 32,
+        flush_interval: float = 0.1,
+        backend:        str   = "logging",
+        color:          bool | None = None
+    ):
         """
         Initializes the custom Rich-enhanced logger.
 
-        Creates a Rich console for styled output and configures a standard
-        Python logger with a RichHandler to display timestamps, paths, and 
-        colorized text. If no handlers exist, one is added to prevent duplicate
-        log output. Finally, dynamically attaches category-specific log methods
-        via `_attach_log_methods()`.
+        Uses the shared Rich console for styled output and configures a
+        standard Python logger with a RichHandler to display timestamps,
+        paths, and colorized text. If no handlers exist, one is added to
+        prevent duplicate log output. Category-specific log methods are
+        already attached to the class by `_attach_log_methods()`, so none are
+        created per instance.
+
+        Only the first logger created with a given `name` configures it; later
+        ones share its handlers and output mode and ignore the other options,
+        for as long as the handler it installed remains attached.
+
+        With `pretty=False` (or the `RICHLOGGER_PLAIN=1` environment variable)
+        a plain stdout `StreamHandler` with precomputed ANSI labels is used
+        instead, skipping Rich's per-record markup parsing and rendering.
+
+        With `queued=True` the calling thread only enqueues records; a
+        `QueueListener` formats and writes them on a background thread until
+        `stop()` is called or the interpreter exits.
+
+        With `show_path=True` each record shows the file and line of the call
+        site. This is off by default because resolving the caller walks the
+        stack for every record.
+
+        With `buffered=True` plain output is collected and written in batches
+        instead of once per record, once `buffer_size` records are waiting or
+        `flush_interval` seconds after the first; warnings and errors still
+        flush at once. Has no effect on Rich output.
+
+        With `backend="fast"` lines with ANSI labels are written directly to
+        stdout without creating log records or going through any handler.
+        Levels set on `self.logger` are still honored; the output options
+        above are ignored.
+
+        Plain and fast output use ANSI colors only when stdout is a terminal
+        and `NO_COLOR` is unset; pass `color=True` or `color=False` to force
+        either. Rich output makes the same decision through its console.
         """
-        self.console = Console()
-        self.logger  = logging.getLogger(name)
+        if backend not in {"logging", "fast"}:
+            raise ValueError(f"Unknown backend {backend!r}")
+
+        self.logger   = logging.getLogger(name)
+        self._emit    = self.logger.log  # Pre-bound to skip a lookup per call
+        self._enabled = self.logger.isEnabledFor
+
+        # Bypass `logging` output entirely
+        if backend == "fast":
+            self.pretty = False
+            self._style = _ANSI if _use_color(sys.stdout, color) else _BARE
+            self._emit  = _FastEmitter(sys.stdout)
+            if self.logger.level == logging.NOTSET:
+                self.logger.setLevel(logging.DEBUG)
+            return
+
+        # Reuse the setup of an earlier logger with the same name, but only
+        # while the handler it installed is still attached
+        setup = _CONFIGURED.get(name)
+        if setup is not None and setup.handler in self.logger.handlers:
+            self._style = setup.style
+            self.pretty = self._style == _RICH
+            if not setup.show_path:
+                self._emit = partial(_log_without_caller, self.logger)
+            return
+
+        # Otherwise drain a listener left over from a discarded setup
+        if setup is not None and setup.listener is not None:
+            setup.listener.stop()
+
+        self.pretty = pretty and os.environ.get("RICHLOGGER_PLAIN") != "1"
+        if self.pretty:
+            self._style = _RICH
+        else:
+            self._style = _ANSI if _use_color(sys.stdout, color) else _BARE
         self.logger.setLevel(logging.DEBUG)
 
-        # Add RichHandler if no handlers exist
+        # Add a handler if no handlers exist
         if not self.logger.handlers:
-            handler = RichHandler(
-                console    = self.console,
-                show_time  = True,     # Display timestamps
-                show_level = False,    # Hide default logging levels
-                show_path  = True,     # Show file path and line number
-                markup     = True,
-                rich_tracebacks = True
-            )
+            if self.pretty:
+                timestamp = _TimestampCache()
+                handler   = RichHandler(
+                    console    = self.console,
+                    show_time  = True,       # Display timestamps
+                    show_level = False,      # Hide default logging levels
+                    show_path  = show_path,  # Show file path and line number
+                    markup     = True,
+                    rich_tracebacks = True,
+                    log_time_format = lambda log_time: Text(
+                        timestamp(log_time.timestamp())
+                    )
+                )
+            else:
+                fmt = "%(asctime)s %(message)s"
+                if show_path:
+                    fmt += " %(filename)s:%(lineno)d"
+                if buffered:
+                    handler = _BufferedStreamHandler(
+                        sys.stdout, 
+                        capacity       = buffer_size, 
+                        flush_interval = flush_interval
+                    )
+                else:
+                    handler = logging.StreamHandler(sys.stdout)
+                handler.setFormatter(_CachedTimeFormatter(
+                    fmt     = fmt,
+                    datefmt = "[%x %X]"
+                ))
             handler.setLevel(logging.NOTSET)  # Pass all messages through
+
+            # Hand the handler to a background listener, if requested
+            listener = None
+            if queued:
+                log_queue = queue.Queue(-1)
+                listener  = QueueListener(
+                    log_queue, 
+                    handler, 
+                    respect_handler_level = True
+                )
+                listener.start()
+                atexit.register(self.stop)
+                handler = _LocalQueueHandler(log_queue)
+
             self.logger.addHandler(handler)
             self.logger.propagate = False     # Avoid duplicate messages
 
-        # Dynamically attach logging methods
-        self._attach_log_methods()
+            # Skip the stack walk when no handler displays the caller
+            if not show_path:
+                self._emit = partial(_log_without_caller, self.logger)
+
+            _CONFIGURED[name] = _Setup(
+                self._style, 
+                show_path, 
+                handler, 
+                listener
+            )
+
+    # ─────────────────────────────────
+    # Console Access
+    # ─────────────────────────────────
+    @property
+    def console(self):
+        """
+        The shared Rich console, created on first access so that plain and
+        fast output never probe the terminal.
+        """
+        return _get_console()
+
+    # ─────────────────────────────────
+    # Level Control
+    # ─────────────────────────────────
+    def setLevel(self, level):
+        """
+        Sets the threshold of the underlying logger.
+
+        Messages below `level` are then dropped by every log method before any
+        formatting or record creation. Changing the level through `logging`
+        directly has the same effect, since the stdlib invalidates its cached
+        `isEnabledFor()` results on every level change.
+        """
+        self.logger.setLevel(level)
+
+    # ─────────────────────────────────
+    # Background Listener
+    # ─────────────────────────────────
+    def stop(self):
+        """
+        Drains any queued records and stops the background listener.
+
+        The listener belongs to the logger name, so any `RichLogger` sharing
+        the name can stop it. The real handler is attached directly in place
+        of the queue, so later records are still written, synchronously.
+        Does nothing when the name was not set up with `queued=True` or has
+        already been stopped.
+        """
+        setup = _CONFIGURED.get(self.logger.name)
+        if setup is None or setup.listener is None:
+            return
+
+        handler = setup.listener.handlers[0]
+        self.logger.addHandler(handler)
+        self.logger.removeHandler(setup.handler)
+        setup.listener.stop()
+        _CONFIGURED[self.logger.name] = setup._replace(
+            handler  = handler, 
+            listener = None
+        )
 
     # ─────────────────────────────────
     # Core Logging Method
     # ─────────────────────────────────
-    def log(self, message, label, level = logging.DEBUG, color = "white"):
+    def log(
+        self, 
+        message, 
+        label, 
+        level    = logging.DEBUG, 
+        color    = "white", 
+        exc_info = None
+    ):
         """
         Logs a message with a color-formatted label using Rich markup.
 
         Applies color styling to the label, aligns it for readability, and 
-        passes the formatted message to the underlying logger at logging level
-        that will catch all messages without filtering. Include the traceback
-        to the most recent call when `verbose()` is called.
+        passes the message to the underlying logger for lazy `%`-formatting
+        at a logging level that will catch all messages without filtering.
+        Include the traceback to the most recent call when `verbose()` is
+        called. Returns early, before any formatting, when the logger would
+        discard `level` anyway.
+
+        `exc_info` defaults to including the traceback for DEBUG labels only;
+        pass it explicitly to override that and skip the label comparison.
         """
-        rich_label = f"[{color}]{label:<10}[/]"
+        if not self._enabled(level):
+            return
+
+        if exc_info is None:
+            exc_info = label.upper() == "DEBUG"
+
+        if self._style == _RICH:
+            styled_label = f"[{color}]{label:<10}[/]"
+        elif self._style == _ANSI:
+            styled_label = _ansi_label(label, color)
+        else:
+            styled_label = f"{label:<10}"
 
-        self.logger.log(
+        self._emit(
             level,
-            f"{rich_label} {message}",
-            exc_info = label.upper() in {"DEBUG"}
+            "%s %s",
+            styled_label,
+            message,
+            exc_info   = exc_info,
+            stacklevel = 2    # Attribute the record to the caller
         )
 
     # ─────────────────────────────────
     # Dynamic Method Attachment
     # ─────────────────────────────────
-    def _attach_log_methods(self):
+    def __init_subclass__(cls, **kwargs):
+        """
+        Attaches log methods for subclasses, which may override
+        `LOG_CATEGORIES` with their own semantics.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._attach_log_methods()
+
+    @classmethod
+    def _attach_log_methods(cls):
         """
-        Dynamically creates and binds instance methods for each log category.
+        Dynamically creates and binds class methods for each log category.
 
         For every entry in LOG_CATEGORIES, this function defines a new method
-        on the instance (e.g., `self.info()`, `self.error()`, etc.) that logs 
+        on the class (e.g., `self.info()`, `self.error()`, etc.) that logs 
         messages with the corresponding label, color, and log level specified 
-        in that category.
-        """
-        for method_name, properties in self.LOG_CATEGORIES.items():
-            def log_method(self, message, props = properties):
-                self.log(
-                    message, 
-                    props["label"], 
-                    color = props["color"], 
-                    level = props["level"]
-                )
-            
-            setattr(
-                self, 
+        in that category. Runs once per class rather than once per instance.
+        The resolved categories are kept in `_CATEGORIES`.
+        """
+        cls._CATEGORIES = tuple(
+            _Category.from_properties(
                 method_name, 
-                log_method.__get__(self, self.__class__)
+                properties, 
+                cls.SAMPLE_RATES.get(method_name, 1.0)
+            )
+            for method_name, properties in cls.LOG_CATEGORIES.items()
+        )
+        for category in cls._CATEGORIES:
+            log_method = cls._make_log_method(category)
+            log_method.__qualname__ = f"{cls.__qualname__}.{category.name}"
+            setattr(cls, category.name, log_method)
+
+    @staticmethod
+    def _make_log_method(category):
+        """
+        Builds the log method for a single category.
+
+        Generates and compiles source specialized to the category, with its
+        level, formats, traceback flag, and sample rate written in as
+        literals, so a call performs no dictionary or closure lookups.
+        Sampled categories draw a random number before any other work; the
+        rest have no sampling code at all.
+        """
+        name = category.name
+        if not name.isidentifier() or keyword.iskeyword(name):
+            raise ValueError(
+                f"Log category {category.name!r} is not a valid method name"
+            )
+
+        sampling = ""
+        if category.sample_rate < 1.0:
+            sampling = (
+                f"    if _random() >= {category.sample_rate!r}:\n"
+                f"        return\n"
             )
+
+        source = (
+            f"def {category.name}(self, message):\n"
+            f"{sampling}"
+            f"    if not self._enabled({int(category.level)}):\n"
+            f"        return\n"
+            f"    self._emit(\n"
+            f"        {int(category.level)},\n"
+            f"        {category.formats!r}[self._style],\n"
+            f"        message,\n"
+            f"        exc_info   = {category.exc_info!r},\n"
+            f"        stacklevel = 2\n"
+            f"    )\n"
+        )
+        namespace = {"__name__": __name__, "_random": random.random}
+        exec(compile(source, f"<log method {category.name}>", "exec"),
+             namespace)
+
+        log_method = namespace[category.name]
+        log_method.__doc__ = f"Logs a message with the {category.label} label."
+        return log_method
+
+RichLogger._attach_log_methods()
@@ -2,7 +2,14 @@
 # Minimal test for the RichLogger module
 # ─────────────────────────────────────────────────────────────────────────────
 
+import gc
+import inspect
+import logging
+import os
+import time
+import weakref
 import pytest
+from datetime    import datetime
 from time        import sleep
 from rich_logger import RichLogger
 
@@ -66,3 +73,339 @@ def test_logger_execution(capsys):
     out, err = capsys.readouterr()
     assert "Loading dataset" in out
     assert "Failure" in out
+
+
+def test_plain_output(capsys):
+    """
+    Plain mode writes precomputed ANSI labels straight to stdout.
+    """
+    logger = RichLogger("demo_plain", pretty = False, color = True)
+    logger.read("Loading dataset")
+
+    out, err = capsys.readouterr()
+    assert "\x1b[35mREAD      \x1b[0m Loading dataset" in out
+
+
+def test_queued_output(capsys):
+    """
+    Queued mode writes every record once the listener is drained.
+    """
+    logger = RichLogger("demo_queued", pretty = False, queued = True)
+    for i in range(3):
+        logger.step(f"Record {i}")
+    logger.stop()
+
+    out, err = capsys.readouterr()
+    assert out.count("Record") == 3
+
+
+def test_queued_after_stop(capsys):
+    """
+    Records logged after stop(), from any instance of the name, are written.
+    """
+    RichLogger("demo_stopped", pretty = False, queued = True)
+    logger = RichLogger("demo_stopped")
+    logger.stop()
+    logger.step("Record 1")
+
+    out, err = capsys.readouterr()
+    assert "Record 1" in out
+
+
+def test_queued_mutable_message(capsys):
+    """
+    Queued records render the message as it was when logged.
+    """
+    logger  = RichLogger("demo_mutable", pretty = False, queued = True)
+    message = ["before"]
+    logger.step(message)
+    message[0] = "after"
+    logger.stop()
+
+    out, err = capsys.readouterr()
+    assert "before" in out and "after" not in out
+
+
+def test_subclass_categories(capsys):
+    """
+    Subclasses overriding LOG_CATEGORIES get their own log methods.
+    """
+    class CustomLogger(RichLogger):
+        LOG_CATEGORIES = {
+            "trace": {"label": "TRACE", "color": "white", "level": 20},
+        }
+
+    logger = CustomLogger("demo_subclass", pretty = False)
+    logger.trace("Custom category")
+
+    out, err = capsys.readouterr()
+    assert "TRACE" in out and "Custom category" in out
+
+
+def test_buffered_output(capsys):
+    """
+    Buffered mode holds records until flushed, except warnings and above.
+    """
+    logger = RichLogger(
+        "demo_buffered", 
+        pretty         = False, 
+        buffered       = True, 
+        flush_interval = 60
+    )
+    logger.step("Record 1")
+    logger.step("Record 2")
+    assert "Record" not in capsys.readouterr().out
+
+    logger.warning("Threshold exceeded")
+    out, err = capsys.readouterr()
+    assert out.index("Record 2") < out.index("Threshold exceeded")
+
+
+def test_buffered_file_handler(tmp_path):
+    """
+    BufferedFileHandler writes held records when the handler is closed.
+    """
+    from rich_logger import BufferedFileHandler
+
+    path    = tmp_path / "run.log"
+    logger  = RichLogger("demo_file", pretty = False)
+    handler = BufferedFileHandler(path)
+    logger.logger.addHandler(handler)
+    logger.step("Record 1")
+    logger.step("Record 2")
+    handler.close()
+    logger.logger.removeHandler(handler)
+
+    assert path.read_text().count("Record") == 2
+
+
+def test_sampled_categories(capsys):
+    """
+    Categories with a zero sample rate are dropped; others are unaffected.
+    """
+    class SampledLogger(RichLogger):
+        SAMPLE_RATES = {"check": 0.0}
+
+    logger = SampledLogger("demo_sampled", pretty = False)
+    for i in range(10):
+        logger.check(f"Sampled {i}")
+    logger.step("Kept")
+
+    out, err = capsys.readouterr()
+    assert "Sampled" not in out and "Kept" in out
+
+
+def test_reused_name(capsys):
+    """
+    A second logger with the same name adopts the first one's output mode.
+    """
+    RichLogger("demo_reused", pretty = False, color = True)
+    logger = RichLogger("demo_reused")
+    logger.read("Loading dataset")
+
+    out, err = capsys.readouterr()
+    assert logger.pretty is False
+    assert "\x1b[35mREAD      \x1b[0m Loading dataset" in out
+
+
+def test_fast_backend(capsys):
+    """
+    The fast backend writes ANSI-labelled lines without logging handlers.
+    """
+    logger = RichLogger("demo_fast", backend = "fast", color = True)
+    logger.read("Loading dataset")
+
+    out, err = capsys.readouterr()
+    assert not logger.logger.handlers
+    assert "\x1b[35mREAD      \x1b[0m Loading dataset\n" in out
+
+
+def test_set_level(capsys):
+    """
+    Categories below the logger's level are dropped.
+    """
+    logger = RichLogger("demo_level", pretty = False)
+    logger.setLevel(logging.INFO)
+    logger.debug("Hidden")
+    logger.info("Shown")
+
+    out, err = capsys.readouterr()
+    assert "Hidden" not in out and "Shown" in out
+
+
+def test_uncolored_output(capsys):
+    """
+    Plain output to a non-terminal stream drops the ANSI escapes.
+    """
+    logger = RichLogger("demo_uncolored", pretty = False)
+    logger.read("Loading dataset")
+
+    out, err = capsys.readouterr()
+    assert "\x1b[" not in out
+    assert "READ       Loading dataset" in out
+
+
+def test_recreated_after_handlers_cleared(capsys):
+    """
+    A logger whose handlers were removed is set up again when re-created.
+    """
+    logger = RichLogger("demo_recreated", pretty = False)
+    logger.logger.handlers.clear()
+
+    logger = RichLogger("demo_recreated", pretty = False)
+    logger.step("Record 1")
+
+    out, err = capsys.readouterr()
+    assert logger.logger.handlers
+    assert "Record 1" in out
+
+
+def test_caller_kept_for_other_handlers():
+    """
+    Hiding the path skips the stack walk only for RichLogger's own calls.
+    """
+    logger  = RichLogger("demo_caller", pretty = False)
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.logger.addHandler(handler)
+
+    logger.step("Own call")
+    logger.logger.info("Direct call")
+    logger.logger.removeHandler(handler)
+
+    assert records[0].lineno == 0
+    assert records[1].pathname == __file__ and records[1].lineno > 0
+
+
+def test_buffered_write_error(capsys, monkeypatch):
+    """
+    A failed batched write is reported through handleError and dropped.
+    """
+    logger  = RichLogger("demo_write_error", pretty = False, buffered = True)
+    handler = logger.logger.handlers[0]
+    errors  = []
+    monkeypatch.setattr(handler, "handleError", errors.append)
+    monkeypatch.setattr(handler.stream, "write", lambda text: 1 / 0)
+
+    logger.step("Record 1")
+    handler.flush()
+
+    assert len(errors) == 1 and errors[0].getMessage().endswith("Record 1")
+    assert not handler._buffer
+
+
+def test_show_path_reports_call_site(capsys):
+    """
+    With show_path=True, records point at the caller, not at rich_logger.py.
+    """
+    logger = RichLogger("demo_path", pretty = False, show_path = True)
+    method_line = inspect.currentframe().f_lineno + 1
+    logger.step("Record 1")
+    log_line = inspect.currentframe().f_lineno + 1
+    logger.log("Record 2", "CUSTOM", level = logging.INFO)
+
+    out, err = capsys.readouterr()
+    filename = os.path.basename(__file__)    # test_logger.py
+    assert f"{filename}:{method_line}" in out
+    assert f"{filename}:{log_line}" in out
+    assert "rich_logger.py" not in out
+
+
+def test_freed_without_gc():
+    """
+    A discarded logger is freed by reference counting alone.
+    """
+    RichLogger("demo_freed", pretty = False)
+    gc.disable()
+    try:
+        ref = weakref.ref(RichLogger("demo_freed", pretty = False))
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_buffered_file_handler_after_close(tmp_path):
+    """
+    BufferedFileHandler reopens its file for records logged after close().
+    """
+    from rich_logger import BufferedFileHandler
+
+    path    = tmp_path / "run.log"
+    logger  = RichLogger("demo_file_reopen", pretty = False)
+    handler = BufferedFileHandler(path)
+    logger.logger.addHandler(handler)
+    logger.step("Record 1")
+    handler.close()
+    for i in range(2, 12):
+        logger.step(f"Record {i}")
+    handler.close()
+    logger.logger.removeHandler(handler)
+
+    assert path.read_text().count("Record") == 11
+    assert not handler._buffer
+
+
+def test_sample_rate_coercion():
+    """
+    Non-float sample rates are accepted; out-of-range ones are rejected.
+    """
+    from fractions import Fraction
+
+    class FractionLogger(RichLogger):
+        SAMPLE_RATES = {"check": Fraction(0)}
+
+    FractionLogger("demo_fraction", pretty = False).check("Dropped")
+
+    with pytest.raises(ValueError):
+        class InvalidLogger(RichLogger):
+            SAMPLE_RATES = {"check": 1.5}
+
+
+def test_console_created_lazily(monkeypatch):
+    """
+    Plain and fast loggers never create the Rich console.
+    """
+    from rich_logger import rich_logger as module
+
+    monkeypatch.setattr(module, "_SHARED_CONSOLE", None)
+    RichLogger("demo_lazy_plain", pretty = False)
+    RichLogger("demo_lazy_fast", backend = "fast")
+    assert module._SHARED_CONSOLE is None
+
+    RichLogger("demo_lazy_pretty")
+    assert module._SHARED_CONSOLE is not None
+
+
+def test_timestamp_cache():
+    """
+    Timestamps within one second share a cached string; the next second
+    formats a new one.
+    """
+    from rich_logger.rich_logger import _TimestampCache
+
+    timestamp = _TimestampCache()
+    first     = timestamp(1_000_000.1)
+
+    assert timestamp(1_000_000.9) is first
+    assert first == time.strftime("[%x %X]", time.localtime(1_000_000))
+    assert timestamp(1_000_001.0) == time.strftime(
+        "[%x %X]", time.localtime(1_000_001)
+    )
+
+
+def test_timestamp_formats(capsys):
+    """
+    Plain and Rich output keep the `[%x %X]` time format.
+    """
+    logger = RichLogger("demo_time_plain", pretty = False)
+    logger.step("Record 1")
+    out, err = capsys.readouterr()
+    time.strptime(out[:out.index("]") + 1], "[%x %X]")
+
+    logger     = RichLogger("demo_time_rich")
+    log_render = logger.logger.handlers[0]._log_render
+    log_time   = datetime.fromtimestamp(1_000_000)
+    assert log_render.time_format(log_time).plain == log_time.strftime(
+        "[%x %X]"
+    )